@@ -1,12 +1,17 @@
 # Import necessary libraries
 # - TextBlob for natural language processing tasks like sentiment analysis
+#   (imported lazily in `_polarity`, so startup and commands stay fast)
 import colorama
-from textblob import TextBlob
 # - Colorama for colored terminal output
 from colorama import Fore, Style, init
-# - sys and time for animations and delays
+# - sys for terminal output
 import sys
-import time
+# - functools for caching repeated sentiment lookups
+import functools
+# - threading to run the loading animation (and its delays) alongside the analysis
+import threading
+# - deque to keep a bounded conversation history, Counter for sentiment counts
+from collections import Counter, deque
 
 # Initialize Colorama to reset terminal colors automatically after each output
 colorama.init(autoreset=True)
@@ -15,58 +20,74 @@ colorama.init(autoreset=True)
 # Define global variables
 # - `user_name`: To store the name of the user (Agent)
 user_name = ""
-# - `conversation_history`: A list to store all user inputs
-conversation_history = []
-# - Sentiment counters (`positive_count`, `negative_count`, `neutral_count`) to track sentiment trends
-positive_count = 0
-negative_count = 0
-neutral_count = 0
+# - `conversation_history`: The most recent user inputs (oldest are dropped past the cap)
+HISTORY_LIMIT = 1000
+conversation_history = deque(maxlen=HISTORY_LIMIT)
+# - `history_total`: How many inputs have been recorded since the last reset
+history_total = 0
+# - `sentiment_counts`: Counts of "positive", "negative" and "neutral" sentences to track sentiment trends
+sentiment_counts = Counter()
 
 # Define a function to simulate a processing animation
-def loading_dots():
-    """Simulate a loading animation with dots."""
-    print("Analyzing your sentiment", end="")
+def _animate(done):
+    """Print up to three dots, stopping early once `done` is set."""
+    print("Analyzing your sentiment", end="", flush=True)
     for _ in range(3):
         print(".", end="", flush=True)
-        time.sleep(0.5)  # Delay for half a second
+        if done.wait(0.5):  # Delay for half a second unless analysis finished
+            break
     print()  # New line after the loading animation
+
+def loading_dots(done):
+    """Start the loading animation in a background thread and return it."""
+    animation = threading.Thread(target=_animate, args=(done,), daemon=True)
+    animation.start()
+    return animation
 # - Prints "loading dots" to make the chatbot feel interactive
 
 # - Use a loop to display three dots with a slight delay
+# - Runs in a thread so the analysis does not wait for the animation
+
+# Define a cached helper that computes the polarity of a (normalized) sentence
+@functools.lru_cache(maxsize=1024)
+def _polarity(text: str) -> float:
+    """Return the TextBlob polarity of the text, caching repeated sentences."""
+    from textblob import TextBlob
+    return TextBlob(text).sentiment.polarity
 
 # Define a function to analyze sentiment of the text
 def analyze_sentiment(text):
     """Analyze the sentiment of the input text and update sentiment counters."""
-    global positive_count, negative_count, neutral_count, conversation_history
+    global history_total
 
-    # Create a TextBlob object for sentiment analysis
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity  # Get the polarity score
+    # Get the polarity score (repeated sentences are served from the cache)
+    polarity = _polarity(text.strip().lower())
 
     # Determine sentiment category based on polarity
     if polarity > 0.5:
         sentiment = "Very Positive"
-        positive_count += 1
+        sentiment_counts["positive"] += 1
         color = Fore.GREEN
     elif polarity > 0:
         sentiment = "Positive"
-        positive_count += 1
+        sentiment_counts["positive"] += 1
         color = Fore.LIGHTGREEN_EX
     elif polarity == 0:
         sentiment = "Neutral"
-        neutral_count += 1
+        sentiment_counts["neutral"] += 1
         color = Fore.YELLOW
     elif polarity < -0.5:
         sentiment = "Very Negative"
-        negative_count += 1
+        sentiment_counts["negative"] += 1
         color = Fore.RED
     else:
         sentiment = "Negative"
-        negative_count += 1
+        sentiment_counts["negative"] += 1
         color = Fore.LIGHTRED_EX
 
     # Append the user input to conversation history
     conversation_history.append(text)
+    history_total += 1
 
     # Print the result with color coding
     print(f"{color}Sentiment: {sentiment}{Style.RESET_ALL}")
@@ -80,20 +101,21 @@ def analyze_sentiment(text):
 # Define a function to handle commands
 def handle_command(command):
     """Handle special commands like summary, reset, history, and help."""
-    global positive_count, negative_count, neutral_count, conversation_history
+    global history_total
 
     if command == "summary":
         print(f"{Fore.CYAN}Summary of Sentiments:{Style.RESET_ALL}")
-        print(f"Positive: {positive_count}, Negative: {negative_count}, Neutral: {neutral_count}")
+        print(f"Positive: {sentiment_counts['positive']}, Negative: {sentiment_counts['negative']}, Neutral: {sentiment_counts['neutral']}")
     elif command == "reset":
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
+        sentiment_counts.clear()
         conversation_history.clear()
+        history_total = 0
         print(f"{Fore.YELLOW}Conversation history and sentiment counters have been reset.{Style.RESET_ALL}")
     elif command == "history":
         print(f"{Fore.MAGENTA}Conversation History:{Style.RESET_ALL}")
-        for i, sentence in enumerate(conversation_history, start=1):
+        print(f"(showing last {len(conversation_history)} of {history_total})")
+        first = history_total - len(conversation_history) + 1
+        for i, sentence in enumerate(conversation_history, start=first):
             print(f"{i}. {sentence}")
     elif command == "help":
         print(f"{Fore.BLUE}Available Commands:{Style.RESET_ALL}")
@@ -110,6 +132,9 @@ def handle_command(command):
 # - `help`: Displays a list of available commands
 # - Return appropriate responses for each command
 
+# Commands understood by `handle_command` (checked with a single set lookup)
+COMMANDS = frozenset({"summary", "reset", "history", "help"})
+
 # Define a function to validate the user's name
 def validate_name(name):
     """Validate the user's name to ensure it is alphabetic and not empty."""
@@ -146,19 +171,18 @@ def start_sentiment_chat():
             print(f"{Fore.RED}Please enter a valid sentence.{Style.RESET_ALL}")
             continue
 
-        if user_input.lower() == "exit":
+        command = user_input.lower()
+        if command == "exit":
             print(f"{Fore.CYAN}Thank you for using Sentiment Spy, {user_name}! Goodbye!{Style.RESET_ALL}")
             break
-        elif user_input.lower() == "summary":
-            handle_command("summary")
-        elif user_input.lower() == "reset":
-            handle_command("reset")
-        elif user_input.lower() == "history":
-            handle_command("history")
-        elif user_input.lower() == "help":
-            handle_command("help")
+        elif command in COMMANDS:
+            handle_command(command)
         else:
-            loading_dots()
+            done = threading.Event()
+            animation = loading_dots(done)
+            _polarity(user_input.strip().lower())  # Warm the cache while the dots animate
+            done.set()
+            animation.join()
             analyze_sentiment(user_input)
 # - Display a welcome message and introduce the Sentiment Spy activity
 # - Ask the user for their name and store it in the `user_name` variable
@@ -6,21 +6,37 @@ from colorama import Fore, init
 # Initialize colorama (autoreset ensures each print resets after use)
 init(autoreset=True)
 
-# Destination & joke data
+# Destination & joke data (tuples: never modified at runtime)
 destinations = {
-    "beaches": ["Bali", "Maldives", "Phuket"],
-    "mountains": ["Swiss Alps", "Rocky Mountains", "Himalayas"],
-    "cities": ["Tokyo", "Paris", "New York"]
+    "beaches": ("Bali", "Maldives", "Phuket"),
+    "mountains": ("Swiss Alps", "Rocky Mountains", "Himalayas"),
+    "cities": ("Tokyo", "Paris", "New York")
 }
-jokes = [
+jokes = (
     "Why don't programmers like nature? Too many bugs!",
     "Why did the computer go to the doctor? Because it had a virus!",
     "Why do travelers always feel warm? Because of all their hot spots!"
-]
+)
+
+# Packing data: items for every trip, plus destination-specific extras
+base_tips = ["Passport/ID", "Wallet & cards", "Phone & charger", "Basic meds", "Toiletries", "Reusable water bottle"]
+destination_tips = {
+    "beaches": ["Swimwear", "Sunscreen (SPF 50+)", "Flip-flops", "Hat & sunglasses", "Light cotton clothes"],
+    "mountains": ["Warm layers / fleece", "Rain jacket", "Hiking boots", "Woolen cap & gloves", "Thermal bottle"],
+    "cities": ["City map / offline maps", "Dressy outfit (optional)", "Compact umbrella", "Small daypack"]
+}
+
+# Precompiled patterns for input cleanup and intent detection
+_WS = re.compile(r"\s+")
+_HELP = re.compile(r"\b(help|menu)\b")
+_REC = re.compile(r"\b(recommend|suggest|travel|trip)\b")
+_PACK = re.compile(r"\b(pack|packing|checklist)\b")
+_JOKE = re.compile(r"\b(joke|funny|laugh)\b")
+_INT = re.compile(r"\d+")
 
 # Helper function to normalize user input (remove extra spaces, make lowercase)
 def normalize_input(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return _WS.sub(" ", text.strip().lower())
 
 # -------- Travel Recommendations (recursive-style refinement) --------
 def provide_recommendations():
@@ -94,24 +110,19 @@ def packing_tips():
     print(Fore.CYAN + "Trip duration in days? (e.g., 3, 5, 7)")
     dur_raw = input(Fore.YELLOW + "> ")
     # Extract first integer found; default to 3 if none
-    m = re.search(r"\d+", dur_raw)
+    m = _INT.search(dur_raw)
     days = int(m.group()) if m else 3
 
-    # Base items
-    tips = ["Passport/ID", "Wallet & cards", "Phone & charger", "Basic meds", "Toiletries", "Reusable water bottle"]
     # Duration-based clothing heuristic
-    tips.append(f"{max(2, days//2 + 1)} casual outfits")
-    tips.append(f"{min(days, 7)} pairs of socks")
-    tips.append(f"{min(days, 5)} sets of innerwear")
-    tips.append("Comfortable walking shoes")
-
-    # Destination-specific adds
-    if dest == "beaches":
-        tips += ["Swimwear", "Sunscreen (SPF 50+)", "Flip-flops", "Hat & sunglasses", "Light cotton clothes"]
-    elif dest == "mountains":
-        tips += ["Warm layers / fleece", "Rain jacket", "Hiking boots", "Woolen cap & gloves", "Thermal bottle"]
-    elif dest == "cities":
-        tips += ["City map / offline maps", "Dressy outfit (optional)", "Compact umbrella", "Small daypack"]
+    duration_tips = [
+        f"{max(2, days//2 + 1)} casual outfits",
+        f"{min(days, 7)} pairs of socks",
+        f"{min(days, 5)} sets of innerwear",
+        "Comfortable walking shoes",
+    ]
+
+    # Base items + clothing + destination-specific adds
+    tips = base_tips + duration_tips + destination_tips[dest]
 
     print(Fore.GREEN + f"Packing tips for a {days}-day {dest} trip:")
     for i, item in enumerate(tips, 1):
@@ -146,13 +157,13 @@ def chat():
                 break
 
             # Intent detection via simple keyword regex
-            if re.search(r"\b(help|menu)\b", user):
+            if _HELP.search(user):
                 show_help()
-            elif re.search(r"\b(recommend|suggest|travel|trip)\b", user):
+            elif _REC.search(user):
                 provide_recommendations()
-            elif re.search(r"\b(pack|packing|checklist)\b", user):
+            elif _PACK.search(user):
                 packing_tips()
-            elif re.search(r"\b(joke|funny|laugh)\b", user):
+            elif _JOKE.search(user):
                 tell_joke()
             else:
                 print(Fore.MAGENTA + "I'm not sure about that. Try 'help' to see options.")
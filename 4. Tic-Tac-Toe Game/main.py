@@ -3,7 +3,8 @@
 # Play modes: Human vs AI, or Human vs Human.
 # Author: You :)
 
-from typing import List, Optional, Tuple
+import sys
+from typing import Dict, List, Optional, Tuple
 
 # -------- Board Representation --------
 # We'll represent the board as a list of 9 characters: [" ", " ", ..., " "]
@@ -15,6 +16,20 @@ from typing import List, Optional, Tuple
 #  6 | 7 | 8
 #
 # The player symbols are 'X' and 'O'.
+#
+# For fast win checks each player's cells are also packed into a 9-bit
+# mask (bit i set = that player owns cell i).
+
+FULL_MASK = 0x1FF
+
+WIN_MASKS = [
+    0b111000000, 0b000111000, 0b000000111,  # rows
+    0b100100100, 0b010010010, 0b001001001,  # cols
+    0b100010001, 0b001010100,               # diagonals
+]
+
+# WON[mask] is 1 if the cells in 'mask' contain a complete line
+WON = bytes(any((m & mask) == m for m in WIN_MASKS) for mask in range(512))
 
 
 def print_board(board: List[str]) -> None:
@@ -26,7 +41,9 @@ def print_board(board: List[str]) -> None:
         "---+---+---",
         f" {board[6]} | {board[7]} | {board[8]} ",
     ]
-    print("\n".join(rows))
+    # Buffered write; the caller flushes once per turn
+    sys.stdout.write("\n".join(rows))
+    sys.stdout.write("\n")
 
 
 def print_positions_guide() -> None:
@@ -39,30 +56,44 @@ def print_positions_guide() -> None:
         "---+---+---",
         " 7 | 8 | 9 ",
     ]
-    print("\n".join(guide))
+    sys.stdout.write("\n".join(guide))
+    sys.stdout.write("\n")
 
 
-def available_moves(board: List[str]) -> List[int]:
-    """Return list of indices that are empty."""
-    return [i for i, cell in enumerate(board) if cell == " "]
+def board_masks(board: List[str]) -> Tuple[int, int]:
+    """Return the (x_mask, o_mask) bitboards for the board."""
+    x_mask = o_mask = 0
+    for i, cell in enumerate(board):
+        if cell == "X":
+            x_mask |= 1 << i
+        elif cell == "O":
+            o_mask |= 1 << i
+    return x_mask, o_mask
 
 
-def winner(board: List[str]) -> Optional[str]:
-    """Return 'X' or 'O' if there is a winner, or None otherwise."""
-    win_lines = [
-        (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
-        (0, 3, 6), (1, 4, 7), (2, 5, 8),  # cols
-        (0, 4, 8), (2, 4, 6)              # diagonals
-    ]
-    for a, b, c in win_lines:
-        if board[a] != " " and board[a] == board[b] == board[c]:
-            return board[a]
+def available_moves(x_mask: int, o_mask: int) -> List[int]:
+    """Return list of indices that are empty."""
+    moves = []
+    empty = ~(x_mask | o_mask) & FULL_MASK
+    while empty:
+        low = empty & -empty  # lowest empty cell
+        moves.append(low.bit_length() - 1)
+        empty ^= low
+    return moves
+
+
+def winner_fast(x_mask: int, o_mask: int) -> Optional[str]:
+    """Return 'X' or 'O' if that player's bitboard has a line, or None."""
+    if WON[x_mask]:
+        return "X"
+    if WON[o_mask]:
+        return "O"
     return None
 
 
-def is_draw(board: List[str]) -> bool:
-    """True if the board is full and no winner."""
-    return winner(board) is None and all(cell != " " for cell in board)
+def is_draw_bb(x_mask: int, o_mask: int) -> bool:
+    """True if the board is full (check for a winner first)."""
+    return (x_mask | o_mask) == FULL_MASK
 
 
 # -------- Human Input Handling --------
@@ -90,53 +121,75 @@ def get_human_move(board: List[str], current_player: str) -> int:
 
 # -------- Minimax AI --------
 # Minimax tries all possible moves, assuming optimal play from both sides.
-# Score convention:
-#   +1 if AI wins, -1 if Human wins, 0 for draw.
+# Score convention (from the point of view of the player to move):
+#   +1 if that player wins, -1 if they lose, 0 for draw.
 #
-# We’ll allow the AI to play as 'O' by default (but you can invert easily).
+# Tic-tac-toe only has a few thousand reachable positions, so instead of
+# searching the game tree on every AI turn we solve the whole game once at
+# import time and store the best move for every position in BEST_MOVE.
+# Positions are keyed by the two bitboards packed into one 18-bit integer.
+
+# encoded board -> best move index for the player whose turn it is
+BEST_MOVE: Dict[int, int] = {}
+
 
-def minimax(board: List[str], ai: str, human: str, maximizing: bool) -> Tuple[int, Optional[int]]:
+def encode_board(x_mask: int, o_mask: int) -> int:
+    """Pack both bitboards into a single integer key."""
+    return x_mask | (o_mask << 9)
+
+
+def minimax(x_mask: int, o_mask: int, empty_mask: int, x_to_move: bool,
+            memo: Dict[int, Tuple[int, Optional[int]]]) -> Tuple[int, Optional[int]]:
     """
-    Return (score, best_move_index) from current board.
-    - 'maximizing' indicates if it's AI's turn (maximize score) or human's (minimize).
+    Return (score, best_move_index) for the player who is about to move.
+    Works on integers only: the two bitboards plus the mask of empty cells.
+    Results are memoized per position in 'memo'; only used to build BEST_MOVE.
     """
-    win = winner(board)
-    if win == ai:
-        return (1, None)
-    if win == human:
-        return (-1, None)
-    if is_draw(board):
-        return (0, None)
-
-    best_move = None
-    if maximizing:
-        best_score = -10  # lower than minimum possible
-        for move in available_moves(board):
-            board[move] = ai
-            score, _ = minimax(board, ai, human, False)
-            board[move] = " "
-            if score > best_score:
-                best_score = score
-                best_move = move
-        return (best_score, best_move)
+    key = encode_board(x_mask, o_mask)
+    if key in memo:
+        return memo[key]
+
+    if WON[x_mask]:
+        result = (1 if x_to_move else -1, None)
+    elif WON[o_mask]:
+        result = (-1 if x_to_move else 1, None)
+    elif not empty_mask:
+        result = (0, None)
     else:
-        best_score = 10  # higher than maximum possible
-        for move in available_moves(board):
-            board[move] = human
-            score, _ = minimax(board, ai, human, True)
-            board[move] = " "
-            if score < best_score:
-                best_score = score
+        best_score = -10  # lower than minimum possible
+        best_move = None
+        empty = empty_mask
+        while empty:
+            low = empty & -empty  # lowest empty cell
+            move = low.bit_length() - 1
+            empty ^= low
+            if x_to_move:
+                score, _ = minimax(x_mask | low, o_mask, empty_mask ^ low, False, memo)
+            else:
+                score, _ = minimax(x_mask, o_mask | low, empty_mask ^ low, True, memo)
+            # The opponent's score is our loss
+            if -score > best_score:
+                best_score = -score
                 best_move = move
-        return (best_score, best_move)
+        result = (best_score, best_move)
+        BEST_MOVE[key] = best_move
+
+    memo[key] = result
+    return result
+
+
+# Solve every position reachable from the empty board ('X' always starts).
+if not BEST_MOVE:
+    minimax(0, 0, FULL_MASK, True, {})
 
 
 def get_ai_move(board: List[str], ai: str, human: str) -> int:
-    """Compute the best move for the AI using minimax."""
-    _, move = minimax(board, ai, human, maximizing=True)
-    # Fallback (shouldn't happen) in case minimax returns None
+    """Look up the best move for the AI in the precomputed table."""
+    x_mask, o_mask = board_masks(board)
+    move = BEST_MOVE.get(encode_board(x_mask, o_mask))
+    # Fallback (shouldn't happen) in case the position was never reached
     if move is None:
-        moves = available_moves(board)
+        moves = available_moves(x_mask, o_mask)
         return moves[0]
     return move
 
@@ -151,9 +204,11 @@ def play_game(vs_ai: bool = True, ai_symbol: str = "O", human_symbol: str = "X")
     - By default, Human is 'X' (starts), AI is 'O'.
     """
     board = [" "] * 9
+    x_mask = o_mask = 0  # bitboards kept in sync with 'board'
     current = "X"  # 'X' always starts
     print_positions_guide()
     print_board(board)
+    sys.stdout.flush()
 
     while True:
         if vs_ai and current == ai_symbol:
@@ -163,16 +218,23 @@ def play_game(vs_ai: bool = True, ai_symbol: str = "O", human_symbol: str = "X")
             move = get_human_move(board, current)
 
         board[move] = current
+        if current == "X":
+            x_mask |= 1 << move
+        else:
+            o_mask |= 1 << move
         print_board(board)
 
-        # Check end conditions
-        win = winner(board)
+        # Check end conditions (written together with the board, one flush)
+        win = winner_fast(x_mask, o_mask)
         if win:
-            print(f"Player {win} wins! 🎉")
+            sys.stdout.write(f"Player {win} wins! 🎉\n")
+            sys.stdout.flush()
             break
-        if is_draw(board):
-            print("It's a draw. 🤝")
+        if is_draw_bb(x_mask, o_mask):
+            sys.stdout.write("It's a draw. 🤝\n")
+            sys.stdout.flush()
             break
+        sys.stdout.flush()
 
         # Switch player
         current = "O" if current == "X" else "X"
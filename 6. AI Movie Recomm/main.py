@@ -8,13 +8,11 @@ Basic Movie Recommender (Very Simple)
     1) --similar_by_title "Some Movie"
     2) --recommend_for_user <user_id>   (optional; needs ratings.csv)
 - Computes everything in-memory, no caching, no complex models.
+- Heavy libraries (pandas, NumPy, scikit-learn) are imported inside the
+  functions that use them, so `--help` and argument errors return quickly.
 """
 
 import argparse
-import pandas as pd
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 # Basic config (change if your CSV uses different column names)
 MOVIE_ID = "movieId"
@@ -23,39 +21,58 @@ GENRES = "genres"
 OVERVIEW = "overview"  # optional
 USER_ID = "userId"
 RATING = "rating"
+RATINGS_CHUNKSIZE = 1_000_000  # rows per chunk when streaming ratings.csv
 
 
-def clean_text(s):
-    if pd.isna(s):
-        return ""
-    return str(s).lower().replace("|", " ")
+def clean_text(col):
+    """Lowercase a text column and turn '|' separators into spaces (NaN -> "")."""
+    return col.fillna("").astype(str).str.lower().str.replace("|", " ", regex=False)
 
 
 def build_tfidf(movies_df):
-    """Build TF-IDF matrix from genres (+ overview if present)."""
-    text_cols = [GENRES] + ([OVERVIEW] if OVERVIEW in movies_df.columns else [])
-    corpus = []
-    for _, row in movies_df.iterrows():
-        parts = [clean_text(row.get(col, "")) for col in text_cols]
-        corpus.append(" ".join(parts).strip())
-
-    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1,1), min_df=1)
-    tfidf = vectorizer.fit_transform(corpus)
+    """
+    Build TF-IDF matrix from genres (+ overview if present).
+    Rows are L2-normalized, so cosine similarity is just a dot product.
+    """
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import normalize
+
+    corpus = clean_text(movies_df[GENRES])
+    if OVERVIEW in movies_df.columns:
+        corpus = corpus + " " + clean_text(movies_df[OVERVIEW])
+    corpus = corpus.str.strip()
+
+    # Cap the vocabulary and store float32 to halve memory. Keep min_df=1:
+    # genre words are few, and a genre used by only one movie still matters.
+    vectorizer = TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1,1),
+        min_df=1,
+        max_features=50_000,
+        dtype=np.float32,
+        sublinear_tf=True,
+    )
+    tfidf = normalize(vectorizer.fit_transform(corpus), norm="l2", copy=False)
     return tfidf, vectorizer
 
 
 def find_similar_by_title(movies_df, tfidf, query_title, top_k=10):
     """Return top_k movies similar to the given title."""
-    # Locate the movie row
-    matches = movies_df[movies_df[TITLE].str.lower() == query_title.lower()]
-    if matches.empty:
-        matches = movies_df[movies_df[TITLE].str.lower().str.contains(query_title.lower(), na=False)]
-    if matches.empty:
+    import numpy as np
+
+    # Locate the movie row (exact match first, then substring)
+    titles_lc = movies_df[TITLE].str.lower()
+    query_lc = query_title.lower()
+    found = titles_lc == query_lc
+    if not found.any():
+        found = titles_lc.str.contains(query_lc, na=False, regex=False)
+    if not found.any():
         raise ValueError(f"Title '{query_title}' not found.")
 
-    ref_idx = matches.index[0]
-    # Compute similarities
-    sims = cosine_similarity(tfidf[ref_idx], tfidf).flatten()
+    ref_idx = found.idxmax()  # first matching row
+    # Compute cosine similarities (rows are already unit length)
+    sims = (tfidf[ref_idx] @ tfidf.T).toarray().ravel()
     # sort by similarity; ignore itself
     order = np.argsort(-sims)
     order = [i for i in order if i != ref_idx][:top_k]
@@ -72,34 +89,45 @@ def recommend_for_user_simple(movies_df, tfidf, ratings_df, user_id, top_k=10):
     2) Average their TF-IDF vectors to make a 'taste' vector.
     3) Recommend top_k nearest movies not already rated.
     """
+    import numpy as np
+
+    movie_ids = movies_df[MOVIE_ID].to_numpy()
+    user_ratings = ratings_df[ratings_df[USER_ID] == user_id]
+
     # Get liked movieIds
-    liked = ratings_df[(ratings_df[USER_ID] == user_id) & (ratings_df[RATING] >= 4.0)][MOVIE_ID].tolist()
-    if not liked:
+    liked = user_ratings.loc[user_ratings[RATING] >= 4.0, MOVIE_ID].to_numpy()
+    if len(liked) == 0:
         raise ValueError(f"User {user_id} has no liked movies (rating >= 4).")
 
-    # Map from row index to movieId
-    id_to_row = {mid: i for i, mid in enumerate(movies_df[MOVIE_ID].tolist())}
-    like_rows = [id_to_row[m] for m in liked if m in id_to_row]
-    if not like_rows:
+    # Row indices of the liked movies
+    like_rows = np.nonzero(np.isin(movie_ids, liked))[0]
+    if len(like_rows) == 0:
         raise ValueError("None of the user's liked movies are present in movies.csv.")
 
-    # Compute centroid of liked vectors
-    centroid = tfidf[like_rows].mean(axis=0)  # 1 x D
+    # Compute centroid of liked vectors, scaled to unit length
+    centroid = np.asarray(tfidf[like_rows].mean(axis=0))  # 1 x D
+    centroid /= np.linalg.norm(centroid) + 1e-12
 
-    # Similarity to all movies
-    sims = cosine_similarity(centroid, tfidf).flatten()
+    # Cosine similarity to all movies
+    sims = np.asarray(tfidf @ centroid.T).ravel()
 
     # Exclude movies the user has already rated
-    already = set(ratings_df[ratings_df[USER_ID] == user_id][MOVIE_ID].tolist())
-    candidates = [(i, sims[i]) for i in range(len(movies_df)) if movies_df.iloc[i][MOVIE_ID] not in already]
-
-    # Top-k
-    candidates.sort(key=lambda x: x[1], reverse=True)
-    top = candidates[:top_k]
+    already = user_ratings[MOVIE_ID].to_numpy()
+    keep = ~np.isin(movie_ids, already)
+    masked_sims = np.where(keep, sims, -np.inf)
+
+    # Top-k: find the k-th best score, keep every row tied with it, then sort
+    # by score and break ties by row order
+    k = min(top_k, int(keep.sum()))
+    if k > 0:
+        kth = -np.partition(-masked_sims, k - 1)[k - 1]
+        rows = np.nonzero(masked_sims >= kth)[0]
+        rows = rows[np.lexsort((rows, -masked_sims[rows]))][:k]
+    else:
+        rows = np.array([], dtype=int)
 
-    rows = [i for i, _ in top]
     out = movies_df.iloc[rows][[MOVIE_ID, TITLE]].copy()
-    out["score"] = [s for _, s in top]
+    out["score"] = sims[rows]
     return out.reset_index(drop=True)
 
 
@@ -112,6 +140,8 @@ def main():
     parser.add_argument("--top_k", type=int, default=10, help="How many results to show")
     args = parser.parse_args()
 
+    import pandas as pd
+
     # Load CSV(s)
     movies_df = pd.read_csv(args.movies_csv)
     # Ensure titles are strings and index is row-order
@@ -130,7 +160,16 @@ def main():
     if args.recommend_for_user is not None:
         if not args.ratings_csv:
             raise SystemExit("Please provide --ratings_csv for user recommendations.")
-        ratings_df = pd.read_csv(args.ratings_csv)
+        # Stream ratings in chunks and keep only this user's rows
+        chunks = pd.read_csv(
+            args.ratings_csv,
+            usecols=[USER_ID, MOVIE_ID, RATING],
+            dtype={USER_ID: "int32", MOVIE_ID: "int32", RATING: "float32"},
+            chunksize=RATINGS_CHUNKSIZE,
+        )
+        ratings_df = pd.concat(
+            [c[c[USER_ID] == args.recommend_for_user] for c in chunks], ignore_index=True
+        )
         res = recommend_for_user_simple(movies_df, tfidf, ratings_df, args.recommend_for_user, top_k=args.top_k)
         print(res.to_string(index=False))
 
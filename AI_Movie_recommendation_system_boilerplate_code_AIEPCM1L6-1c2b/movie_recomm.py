@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -22,7 +23,7 @@ def load_data(file_path='imdb_top_1000.csv'):
 movies_df = load_data()
 
 # Vectorize the combined features and compute cosine similarity
-tfidf = TfidfVectorizer(stop_words='english')
+tfidf = TfidfVectorizer(stop_words='english', max_features=50_000, dtype=np.float32, sublinear_tf=True)
 tfidf_matrix = tfidf.fit_transform(movies_df['combined_features'])
 cosine_sim = cosine_similarity(tfidf_matrix, tfidf_matrix)
 